@@ -1 +1 @@
-from .eval_fits import eval_nrfit
+from .eval_fits import eval_nrfit, eval_nrfit_batch
@@ -170,6 +170,125 @@ def check_extra_params_and_set_defaults(extra_params_dict):
 
 
 
+#=============================================================================
+def _check_model_args(model_name, fit_types_list, extra_params_dict):
+    """ Does the sanity checks that only depend on the model, and not on the
+    binary parameters. Returns extra_params_dict with default values set.
+
+    See eval_nrfit() for the definitions of the arguments of this function.
+    """
+
+    if model_name not in fits_collection.keys():
+        raise ValueError("Invalid model_name=%s. "%model_name \
+            + "Should be one of ["+ ", ".join(fits_collection.keys()) + "].")
+
+    if not type(fit_types_list) == list:
+        raise TypeError("fit_types_list should be a list.")
+
+    # do sanity checks on extra_params_dict and set default values if
+    # required.
+    extra_params_dict = check_extra_params_and_set_defaults(extra_params_dict)
+
+    # Some further sanity checks to makes sure extra_params_dict is
+    # compatible with the given model
+    if (extra_params_dict['Lambda1'] is not None) \
+            or (extra_params_dict['Lambda2'] is not None):
+        if 'tidal' not in fits_collection[model_name].model_keywords:
+            raise ValueError("This model does not allow Lambda1/Lambda2.")
+
+    if (extra_params_dict['eccentricity'] is not None) \
+            or (extra_params_dict['mean_anomaly'] is not None):
+        if 'eccentric' not in fits_collection[model_name].model_keywords:
+            raise ValueError("This model does not allow eccentricity or "
+                    "mean_anomaly.")
+
+    return extra_params_dict
+
+#=============================================================================
+def _eval_nrfit_binary(m1, m2, chiA_vec, chiB_vec, model_name, fit_types_list,
+        f_ref, extra_params_dict):
+    """ Does the sanity checks on the binary parameters and evaluates the fits
+    for a single binary. Assumes that model_name, fit_types_list and
+    extra_params_dict have already been checked by _check_model_args().
+
+    See eval_nrfit() for the definitions of the arguments of this function.
+    """
+
+    ### Sanity checks
+    if m1 < 0.09 * MSUN_SI and f_ref != -1:
+        warnings.warn("Small value of m1 = %e (kg) = %e (Msun) requested. "
+            "When f_ref != -1, component masses must be in kgs, perhaps you "
+            "are using different units?"%(m1, m1/MSUN_SI))
+
+    if m2 < 0.09 * MSUN_SI and f_ref != -1:
+        warnings.warn("Small value of m2 = %e (kg) = %e (Msun) requested. "
+            "When f_ref != -1, component masses must be in kgs, perhaps you "
+            "are using different units?"%(m2, m2/MSUN_SI))
+
+    if m1 <= 0 or m2 <= 0:
+        raise ValueError("Got nonpositive mass: m1=%.3e, m2=%.3e"%(m1,m2))
+
+    chiA_vec = np.atleast_1d(chiA_vec)
+    chiB_vec = np.atleast_1d(chiB_vec)
+    if len(chiA_vec) != 3 or len(chiB_vec) != 3:
+        raise TypeError("Expected input spins to be 3-vectors.")
+
+    if np.linalg.norm(chiA_vec) > 1:
+        raise ValueError("Invalid spin magnitude |chiA_vec|=%.3f."%( \
+            np.linalg.norm(chiA_vec)))
+
+    if np.linalg.norm(chiB_vec) > 1:
+        raise ValueError("Invalid spin magnitude |chiB_vec|=%.3f."%( \
+            np.linalg.norm(chiB_vec)))
+
+    if 'aligned_spin' in fits_collection[model_name].model_keywords:
+        if np.linalg.norm(chiA_vec[:2]) > 0 or np.linalg.norm(chiB_vec[:2]) > 0:
+            raise ValueError("This model only allows nonprecessing spins")
+
+    if 'nonspinning' in fits_collection[model_name].model_keywords:
+        if np.linalg.norm(chiA_vec) > 0 or np.linalg.norm(chiB_vec) > 0:
+            raise ValueError("This model only allows zero spins")
+
+    swapped_labels = False
+    # If m1 < m2, we switch the labels of the two objects, and then rotate the
+    # spins by pi about the z-direction. This amounts to a rigid rotation of
+    # the full system about the z-axis by pi. After computing the remnant
+    # properties, the final spin and kick vectors are rotated by pi to undo
+    # this switch.
+    if m1 < m2:
+        temp = m1
+        m1 = m2
+        m2 = temp
+        temp = chiA_vec
+        chiA_vec = chiB_vec
+        chiB_vec = temp
+        chiA_vec = quaternion_utils.rotate_in_plane(chiA_vec, np.pi)
+        chiB_vec = quaternion_utils.rotate_in_plane(chiB_vec, np.pi)
+        swapped_labels = True
+
+    # Compute NR fit quantities
+    val_dict = fits_collection[model_name].fit_class(m1, m2, chiA_vec, chiB_vec,
+            f_ref, fit_types_list, extra_params_dict)
+
+    # If the output breaks physical limits, truncate it if requested.
+    val_dict = truncate_output_to_physical_limits(val_dict, \
+        extra_params_dict['physical_limit_violation_behavior'])
+
+    # So far FinalMass was dimless, now rescale to same units as total mass
+    if 'FinalMass' in val_dict.keys():
+        val_dict['FinalMass'] *= (m1 + m2)
+
+    # Rotate remnant vectors by pi if the component lables were swapped
+    if swapped_labels:
+        if 'FinalSpin' in val_dict.keys():
+            val_dict['FinalSpin'] = quaternion_utils.rotate_in_plane( \
+                val_dict['FinalSpin'], np.pi)
+        if 'RecoilKick' in val_dict.keys():
+            val_dict['RecoilKick'] = quaternion_utils.rotate_in_plane( \
+                val_dict['RecoilKick'], np.pi)
+
+    return val_dict
+
 #=============================================================================
 def eval_nrfit(m1, m2, chiA_vec, chiB_vec, model_name, fit_types_list, f_ref=-1,
         extra_params_dict=None):
@@ -262,103 +381,91 @@ def eval_nrfit(m1, m2, chiA_vec, chiB_vec, model_name, fit_types_list, f_ref=-1,
         Example: mf = return_dict["FinalMass"]
     """
 
-    ### Sanity checks
-    if model_name not in fits_collection.keys():
-        raise ValueError("Invalid model_name=%s. "%model_name \
-            + "Should be one of ["+ ", ".join(fits_collection.keys()) + "].")
+    extra_params_dict = _check_model_args(model_name, fit_types_list,
+        extra_params_dict)
 
-    if m1 < 0.09 * MSUN_SI and f_ref != -1:
-        warnings.warn("Small value of m1 = %e (kg) = %e (Msun) requested. "
-            "When f_ref != -1, component masses must be in kgs, perhaps you "
-            "are using different units?"%(m1, m1/MSUN_SI))
+    return _eval_nrfit_binary(m1, m2, chiA_vec, chiB_vec, model_name,
+        fit_types_list, f_ref, extra_params_dict)
 
-    if m2 < 0.09 * MSUN_SI and f_ref != -1:
-        warnings.warn("Small value of m2 = %e (kg) = %e (Msun) requested. "
-            "When f_ref != -1, component masses must be in kgs, perhaps you "
-            "are using different units?"%(m2, m2/MSUN_SI))
-
-    if m1 <= 0 or m2 <= 0:
-        raise ValueError("Got nonpositive mass: m1=%.3e, m2=%.3e"%(m1,m2))
-
-    chiA_vec = np.atleast_1d(chiA_vec)
-    chiB_vec = np.atleast_1d(chiB_vec)
-    if len(chiA_vec) != 3 or len(chiB_vec) != 3:
-        raise TypeError("Expected input spins to be 3-vectors.")
-
-    if np.linalg.norm(chiA_vec) > 1:
-        raise ValueError("Invalid spin magnitude |chiA_vec|=%.3f."%( \
-            np.linalg.norm(chiA_vec)))
-
-    if np.linalg.norm(chiB_vec) > 1:
-        raise ValueError("Invalid spin magnitude |chiB_vec|=%.3f."%( \
-            np.linalg.norm(chiB_vec)))
-
-    if not type(fit_types_list) == list:
-        raise TypeError("fit_types_list should be a list.")
-
-
-    # do sanity checks on extra_params_dict and set default values if
-    # required.
-    extra_params_dict = check_extra_params_and_set_defaults(extra_params_dict)
-
-    # Some further sanity checks to makes sure extra_params_dict is
-    # compatible with the given model
-    if (extra_params_dict['Lambda1'] is not None) \
-            or (extra_params_dict['Lambda2'] is not None):
-        if 'tidal' not in fits_collection[model_name].model_keywords:
-            raise ValueError("This model does not allow Lambda1/Lambda2.")
-
-    if (extra_params_dict['eccentricity'] is not None) \
-            or (extra_params_dict['mean_anomaly'] is not None):
-        if 'eccentric' not in fits_collection[model_name].model_keywords:
-            raise ValueError("This model does not allow eccentricity or "
-                    "mean_anomaly.")
 
-    if 'aligned_spin' in fits_collection[model_name].model_keywords:
-        if np.linalg.norm(chiA_vec[:2]) > 0 or np.linalg.norm(chiB_vec[:2]) > 0:
-            raise ValueError("This model only allows nonprecessing spins")
-
-    if 'nonspinning' in fits_collection[model_name].model_keywords:
-        if np.linalg.norm(chiA_vec) > 0 or np.linalg.norm(chiB_vec) > 0:
-            raise ValueError("This model only allows zero spins")
-
-
-    swapped_labels = False
-    # If m1 < m2, we switch the labels of the two objects, and then rotate the
-    # spins by pi about the z-direction. This amounts to a rigid rotation of
-    # the full system about the z-axis by pi. After computing the remnant
-    # properties, the final spin and kick vectors are rotated by pi to undo
-    # this switch.
-    if m1 < m2:
-        temp = m1
-        m1 = m2
-        m2 = temp
-        temp = chiA_vec
-        chiA_vec = chiB_vec
-        chiB_vec = temp
-        chiA_vec = quaternion_utils.rotate_in_plane(chiA_vec, np.pi)
-        chiB_vec = quaternion_utils.rotate_in_plane(chiB_vec, np.pi)
-        swapped_labels = True
-
-    # Compute NR fit quantities
-    val_dict = fits_collection[model_name].fit_class(m1, m2, chiA_vec, chiB_vec,
-            f_ref, fit_types_list, extra_params_dict)
-
-    # If the output breaks physical limits, truncate it if requested.
-    val_dict = truncate_output_to_physical_limits(val_dict, \
-        extra_params_dict['physical_limit_violation_behavior'])
-
-    # So far FinalMass was dimless, now rescale to same units as total mass
-    if 'FinalMass' in val_dict.keys():
-        val_dict['FinalMass'] *= (m1 + m2)
+#=============================================================================
+def eval_nrfit_batch(m1_arr, m2_arr, chiA_arr, chiB_arr, model_name,
+        fit_types_list, f_ref=-1, extra_params_dict=None):
+    """
+    Evaluates Numerical Relativity fits for a given model, for an array of
+    binaries at once.
+
+    The sanity checks on model_name, fit_types_list and extra_params_dict are
+    done once for all binaries, while the checks on the masses and spins are
+    done for each binary, as in eval_nrfit(). See eval_nrfit() for the
+    definitions of the arguments.
+
+    - m1_arr:
+        array of masses of object 1 in kg, shape (N,), with N >= 1. \n
+    - m2_arr:
+        array of masses of object 2 in kg, shape (N,). \n
+    - chiA_arr:
+        array of dimensionless spins of object 1 at the reference epoch,
+        shape (N, 3). \n
+    - chiB_arr:
+        array of dimensionless spins of object 2 at the reference epoch,
+        shape (N, 3). \n
+    - f_ref:
+        reference frequency (in Hz), either a single value used for all
+        binaries or an array of shape (N,). Default: f_ref = -1.
 
-    # Rotate remnant vectors by pi if the component lables were swapped
-    if swapped_labels:
-        if 'FinalSpin' in val_dict.keys():
-            val_dict['FinalSpin'] = quaternion_utils.rotate_in_plane( \
-                val_dict['FinalSpin'], np.pi)
-        if 'RecoilKick' in val_dict.keys():
-            val_dict['RecoilKick'] = quaternion_utils.rotate_in_plane( \
-                val_dict['RecoilKick'], np.pi)
+    - Returns: return_dict. \n
+        Dictionary of arrays corresponding to the keys in fit_types_list.
+        Each array has shape (N,) for scalar fits such as "FinalMass", and
+        shape (N, 3) for vector fits such as "FinalSpin". \n
+        Example: mf_arr = return_dict["FinalMass"]
+    """
 
-    return val_dict
+    ### Sanity checks
+    extra_params_dict = _check_model_args(model_name, fit_types_list,
+        extra_params_dict)
+
+    m1_arr = np.ascontiguousarray(np.atleast_1d(m1_arr), dtype=float)
+    m2_arr = np.ascontiguousarray(np.atleast_1d(m2_arr), dtype=float)
+    chiA_arr = np.ascontiguousarray(np.atleast_2d(chiA_arr), dtype=float)
+    chiB_arr = np.ascontiguousarray(np.atleast_2d(chiB_arr), dtype=float)
+    if m1_arr.ndim != 1 or m2_arr.ndim != 1:
+        raise TypeError("Expected m1_arr and m2_arr to be 1d arrays.")
+
+    num_binaries = len(m1_arr)
+    if num_binaries == 0:
+        raise ValueError("Expected at least one binary, got empty m1_arr.")
+
+    if len(m2_arr) != num_binaries or len(chiA_arr) != num_binaries \
+            or len(chiB_arr) != num_binaries:
+        raise ValueError("Expected m1_arr, m2_arr, chiA_arr and chiB_arr to "
+            "have the same length.")
+
+    if chiA_arr.shape != (num_binaries, 3) \
+            or chiB_arr.shape != (num_binaries, 3):
+        raise TypeError("Expected chiA_arr and chiB_arr to have shape "
+            "(N, 3), got %s and %s."%(chiA_arr.shape, chiB_arr.shape))
+
+    f_ref_arr = np.atleast_1d(f_ref)
+    if f_ref_arr.shape not in [(1,), (num_binaries,)]:
+        raise ValueError("Expected f_ref to be a single value or to have "
+            "shape (N,), got shape %s."%(f_ref_arr.shape,))
+    f_ref_arr = np.broadcast_to(f_ref_arr, (num_binaries,))
+
+    vals_dict = {fit_type: [] for fit_type in fit_types_list}
+    for i in range(num_binaries):
+        val_dict = _eval_nrfit_binary(m1_arr[i], m2_arr[i], chiA_arr[i],
+            chiB_arr[i], model_name, fit_types_list, f_ref_arr[i],
+            extra_params_dict)
+        for fit_type in fit_types_list:
+            vals_dict[fit_type].append(val_dict[fit_type])
+
+    # Stack into arrays, dropping the trailing axis of scalar fits
+    return_dict = {}
+    for fit_type in fit_types_list:
+        vals = np.array(vals_dict[fit_type]).reshape(num_binaries, -1)
+        if vals.shape[1] == 1:
+            vals = vals[:, 0]
+        return_dict[fit_type] = vals
+
+    return return_dict